@@ -0,0 +1,302 @@
+"""Propagate a TLE file over a time grid and emit one row per (satellite, time).
+
+The SGP4 propagation itself is batched: one ``SatrecArray`` call produces
+the full ``(n_sats, n_times)`` position/velocity tensors up front, and the
+row-emission loop only slices into them.
+"""
+
+import argparse
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sgp4 import exporter
+from sgp4.api import SatrecArray, jday
+from skyfield.api import EarthSatellite, load, wgs84
+from skyfield.sgp4lib import TEME_to_ITRF
+from tqdm import tqdm
+
+from src import schema as schema_mod
+from src.features.derive_features import derive_from_frame
+from src.io_utils import CsvSink, ParquetSink
+
+
+# WGS84 ellipsoid constants used by the vectorized geodetic conversion.
+_WGS84_A_KM = 6378.137
+_WGS84_F = 1.0 / 298.257223563
+_WGS84_E2 = _WGS84_F * (2.0 - _WGS84_F)
+
+
+def _itrf_to_geodetic(r_itrf):
+    """Convert ITRF positions ``(3, n)`` km to geodetic lat/lon degree arrays.
+
+    Latitude uses Bowring's method with a few fixed-point refinements,
+    which converges well below SGP4 accuracy for near-Earth orbits.
+    """
+    x, y, z = r_itrf
+    lon = np.degrees(np.arctan2(y, x))
+
+    a = _WGS84_A_KM
+    b = a * (1.0 - _WGS84_F)
+    ep2 = (a * a - b * b) / (b * b)
+    p = np.hypot(x, y)
+    psi = np.arctan2(z * a, p * b)
+    for _ in range(3):
+        sin_psi = np.sin(psi)
+        cos_psi = np.cos(psi)
+        lat = np.arctan2(z + ep2 * b * sin_psi ** 3,
+                         p - _WGS84_E2 * a * cos_psi ** 3)
+        psi = np.arctan2(b * np.sin(lat), a * np.cos(lat))
+    return np.degrees(lat), lon
+
+
+def _build_time_grid(start_dt, end_dt, step):
+    """Return the propagation instants from start to end inclusive.
+
+    The grid is a tz-aware ``DatetimeIndex``, so downstream code can read
+    whole component arrays (``grid.year`` etc.) without per-element
+    datetime arithmetic.
+    """
+    return pd.date_range(start_dt, end_dt, freq=pd.Timedelta(step))
+
+
+def _tle_epoch(sat):
+    """Return the TLE epoch of a Skyfield ``EarthSatellite`` as a UTC datetime."""
+    return sat.epoch.utc_datetime()
+
+
+def _extract_model_fields(sat):
+    """Pull the classical orbital elements out of the underlying SGP4 model."""
+    model = sat.model
+    re_km = model.radiusearthkm
+    return {
+        "inclination_deg": np.degrees(model.inclo),
+        "raan_deg": np.degrees(model.nodeo),
+        "eccentricity": model.ecco,
+        "arg_perigee_deg": np.degrees(model.argpo),
+        "mean_anomaly_deg": np.degrees(model.mo),
+        "mean_motion_rev_per_day": model.no_kozai * 1440.0 / (2.0 * np.pi),
+        "bstar": model.bstar,
+        "perigee_km": model.altp * re_km,
+        "apogee_km": model.alta * re_km,
+        "period_minutes": (2.0 * np.pi) / model.no_kozai,
+    }
+
+
+def _sat_frame(sat, grid, timestamps, cyc_sin, cyc_cos, t_all,
+               r_i, v_i, err_i, lat_i, lon_i, obs):
+    """Build the columnar frame for one satellite over the whole grid."""
+    n = len(grid)
+    # TLE epoch and element fields are constants per satellite; extract
+    # them once here and broadcast, never per timestep.
+    epoch = _tle_epoch(sat)
+    data = {
+        "satellite_name": np.full(n, sat.name, dtype=object),
+        "satellite_id": np.full(n, str(sat.model.satnum), dtype=object),
+        "timestamp_utc": timestamps,
+        "temex": r_i[:, 0],
+        "temey": r_i[:, 1],
+        "temez": r_i[:, 2],
+        "velx": v_i[:, 0],
+        "vely": v_i[:, 1],
+        "velz": v_i[:, 2],
+        "velocity_mag_kms": np.sqrt((v_i ** 2).sum(axis=1)),
+        "sgp4_error_code": err_i.astype(float),
+        "subpoint_lat_deg": lat_i,
+        "subpoint_lon_deg": lon_i,
+        "tle_epoch_utc": np.full(n, epoch.isoformat().replace("+00:00", "Z"),
+                                 dtype=object),
+        "tle_age_hours": np.asarray((grid - epoch).total_seconds()) / 3600.0,
+    }
+
+    data["cyclical_time_sin"] = cyc_sin
+    data["cyclical_time_cos"] = cyc_cos
+
+    if obs is not None:
+        # Array Time in, array alt/az/range out: one Skyfield call per sat.
+        alt, az, dist = (sat - obs).at(t_all).altaz()
+        data["alt_deg"] = alt.degrees
+        data["az_deg"] = az.degrees
+        data["range_km"] = dist.km
+
+    for field, value in _extract_model_fields(sat).items():
+        data[field] = np.full(n, value)
+
+    return pd.DataFrame(data)
+
+
+def _frames_for_sats(sats, ts, grid, observer):
+    """Run the batched pipeline for a list of satellites over ``grid``.
+
+    Returns one schema-ordered DataFrame with derived features filled in.
+    """
+    # One batched SGP4 call for the whole (satellite, time) grid; jday is
+    # plain arithmetic, so it broadcasts over the grid's component arrays.
+    n_times = len(grid)
+    seconds = grid.second.values + grid.microsecond.values / 1e6
+    jd, fr = jday(grid.year.values, grid.month.values, grid.day.values,
+                  grid.hour.values, grid.minute.values, seconds)
+    sat_array = SatrecArray([s.model for s in sats])
+    err, r, v = sat_array.sgp4(jd, fr)
+
+    # One array-valued Time covers the whole grid; every downstream Skyfield
+    # call reuses it instead of rebuilding scalar Times per row.
+    t_all = ts.utc(grid.year.values, grid.month.values, grid.day.values,
+                   grid.hour.values, grid.minute.values, seconds)
+
+    # One batched TEME->ITRF rotation plus a vectorized geodetic
+    # conversion replaces the per-row Skyfield subpoint stack.
+    ut1 = t_all.ut1
+    r_flat = r.transpose(2, 0, 1).reshape(3, -1)
+    v_flat = v.transpose(2, 0, 1).reshape(3, -1)
+    r_itrf, _ = TEME_to_ITRF(np.tile(ut1, len(sats)), r_flat, v_flat)
+    sub_lat, sub_lon = _itrf_to_geodetic(r_itrf)
+    sub_lat = sub_lat.reshape(len(sats), n_times)
+    sub_lon = sub_lon.reshape(len(sats), n_times)
+
+    # The observer is fixed, so its geodetic position is built once
+    # rather than per satellite or per timestep.
+    obs = None
+    if observer is not None:
+        lat, lon, elev = observer
+        obs = wgs84.latlon(lat, lon, elevation_m=elev)
+
+    # Timestamp strings and the time-of-day sin/cos pair are shared by
+    # every satellite in the slice, so compute them once per grid.
+    timestamps = np.array(
+        [d.isoformat().replace("+00:00", "Z") for d in grid], dtype=object
+    )
+    sec = (grid.hour * 3600 + grid.minute * 60 + grid.second).values
+    theta = (2.0 * np.pi / 86400.0) * sec
+    cyc_sin = np.sin(theta)
+    cyc_cos = np.cos(theta)
+
+    frames = [
+        _sat_frame(sat, grid, timestamps, cyc_sin, cyc_cos, t_all,
+                   r[i], v[i], err[i], sub_lat[i], sub_lon[i], obs)
+        for i, sat in enumerate(sats)
+    ]
+    chunk = pd.concat(frames, ignore_index=True)
+    for c, default in schema_mod.COLUMN_DEFAULTS.items():
+        if c not in chunk.columns:
+            chunk[c] = default
+    chunk = chunk[schema_mod.get_column_names()]
+    derive_from_frame(chunk)
+    # Single precision is plenty for km/degree quantities (SGP4 itself is
+    # only good to ~km); raw TEME state vectors stay float64.
+    f32_cols = schema_mod.get_float32_column_names()
+    chunk[f32_cols] = chunk[f32_cols].astype(np.float32)
+    return chunk
+
+
+def _frames_for_tle_lines(triples, grid, observer):
+    """Worker entry point: rebuild satellites from TLE lines and compute.
+
+    Satrec objects do not pickle across processes, so each worker gets the
+    raw (name, line1, line2) triples and its own fresh timescale.
+    """
+    ts = load.timescale()
+    sats = [EarthSatellite(l1, l2, name, ts) for name, l1, l2 in triples]
+    return _frames_for_sats(sats, ts, grid, observer)
+
+
+def process_tle_file(tle_path, out_path, start_dt, end_dt, step,
+                     observer=None, chunk_size=1000, workers=1):
+    """Propagate every satellite in ``tle_path`` over the grid and write it out.
+
+    Output is Parquet (zstd-compressed, schema from ``src.schema``) unless
+    ``out_path`` ends in ``.csv``.  With ``workers > 1`` the satellite list
+    is fanned out across processes, one slice per task; the parent process
+    only serializes results.  Returns the number of rows written.
+    """
+    ts = load.timescale()
+    sats = load.tle_file(str(tle_path), ts=ts)
+    if not sats:
+        raise ValueError(f"no TLEs parsed from {tle_path}")
+
+    grid = _build_time_grid(start_dt, end_dt, step)
+
+    # Slice satellites so each task yields roughly chunk_size rows.
+    per_slice = max(1, math.ceil(chunk_size / len(grid)))
+    slices = [sats[k:k + per_slice] for k in range(0, len(sats), per_slice)]
+
+    arrow_schema = schema_mod.to_arrow_schema()
+    if Path(out_path).suffix.lower() == ".csv":
+        sink = CsvSink(out_path, arrow_schema)
+    else:
+        sink = ParquetSink(out_path, arrow_schema)
+
+    total = 0
+    with sink:
+        if workers is not None and workers > 1 and len(slices) > 1:
+            job = partial(_frames_for_tle_lines, grid=grid, observer=observer)
+            triples = [
+                [(s.name,) + exporter.export_tle(s.model) for s in sl]
+                for sl in slices
+            ]
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                chunks = ex.map(job, triples)
+                for chunk in tqdm(chunks, total=len(slices), desc="slices"):
+                    sink.write(chunk)
+                    total += len(chunk)
+        else:
+            for sl in tqdm(slices, desc="slices"):
+                sink.write(_frames_for_sats(sl, ts, grid, observer))
+                total += len(grid) * len(sl)
+    return total
+
+
+def _parse_utc(value):
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _parse_observer(value):
+    parts = value.split(",")
+    if len(parts) not in (2, 3):
+        raise argparse.ArgumentTypeError("observer must be 'lat,lon[,elev_m]'")
+    lat = float(parts[0])
+    lon = float(parts[1])
+    elev = float(parts[2]) if len(parts) == 3 else 0.0
+    return (lat, lon, elev)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Propagate a TLE file over a time grid into a position dataset."
+    )
+    parser.add_argument("--tle", required=True, help="path to the TLE file")
+    parser.add_argument("--out", required=True,
+                        help="output path (.parquet by default, .csv for CSV)")
+    parser.add_argument("--start", required=True, type=_parse_utc,
+                        help="grid start, ISO-8601 UTC")
+    parser.add_argument("--end", required=True, type=_parse_utc,
+                        help="grid end, ISO-8601 UTC (inclusive)")
+    parser.add_argument("--step-minutes", type=float, default=1.0,
+                        help="grid spacing in minutes")
+    parser.add_argument("--observer", type=_parse_observer, default=None,
+                        help="optional ground observer as 'lat,lon[,elev_m]'")
+    parser.add_argument("--chunk-size", type=int, default=1000,
+                        help="rows buffered before each flush")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes for the satellite fan-out")
+    args = parser.parse_args(argv)
+
+    total = process_tle_file(
+        args.tle, args.out, args.start, args.end,
+        timedelta(minutes=args.step_minutes),
+        observer=args.observer, chunk_size=args.chunk_size,
+        workers=args.workers,
+    )
+    print(f"wrote {total} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Compiled scalar kernels backing the row-wise feature path.
+
+The kernel is deliberately restricted to plain floats (no strings, no
+exception handling) so Numba compiles it in nopython mode.  When Numba is
+not installed the pure-Python function is used as-is.
+"""
+
+from math import cos, pi, sin, sqrt
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+EARTH_MEAN_RADIUS_KM = 6371.0
+_NAN = float("nan")
+
+# The explicit signature forces eager compilation at import time; cache=True
+# persists the compiled result across processes.
+@njit("UniTuple(f8, 5)(f8, f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _derive(x, y, z, vx, vy, vz, sec):
+    """Return (altitude_km, velocity_mag, speed_to_alt_ratio, sin, cos)."""
+    alt = sqrt(x * x + y * y + z * z) - EARTH_MEAN_RADIUS_KM
+    vmag = sqrt(vx * vx + vy * vy + vz * vz)
+    ratio = vmag / alt if alt > 0.0 else _NAN
+    theta = 2.0 * pi * sec / 86400.0
+    return alt, vmag, ratio, sin(theta), cos(theta)
@@ -0,0 +1,131 @@
+"""Derived features computed from the raw position columns."""
+
+import math
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.features._kernels import _derive
+
+EARTH_MEAN_RADIUS_KM = 6371.0
+_TIME_OF_DAY_RAD_PER_SEC = 2.0 * np.pi / 86400.0
+
+
+def derive_from_frame(df):
+    """Fill the derived-feature columns of a whole DataFrame in place.
+
+    Vectorized equivalent of :func:`derive_from_row`: every feature is
+    computed with NumPy ufuncs over full columns, relying on NaN
+    propagation instead of per-row error handling.
+    """
+    df["altitude_km"] = (
+        np.sqrt(df["temex"] ** 2 + df["temey"] ** 2 + df["temez"] ** 2)
+        - EARTH_MEAN_RADIUS_KM
+    )
+    df["speed_to_alt_ratio"] = np.where(
+        df["altitude_km"] > 0,
+        df["velocity_mag_kms"] / df["altitude_km"],
+        np.nan,
+    )
+
+    # The pipeline fills cyclical_time_* straight from the time grid; when
+    # those arrays are present the local-time pair is the same quantity, so
+    # reuse them instead of re-parsing timestamps and re-running the trig.
+    if "cyclical_time_sin" in df and df["cyclical_time_sin"].notna().all():
+        df["local_time_sin"] = df["cyclical_time_sin"]
+        df["local_time_cos"] = df["cyclical_time_cos"]
+    else:
+        # Chunks may already carry parsed timestamps; only string columns
+        # go through the ISO8601 C parser.
+        ts_col = df["timestamp_utc"]
+        if pd.api.types.is_datetime64_any_dtype(ts_col):
+            dt = ts_col
+        else:
+            dt = pd.to_datetime(ts_col, utc=True, format="ISO8601", cache=True)
+        theta = _TIME_OF_DAY_RAD_PER_SEC * (
+            dt.dt.hour * 3600 + dt.dt.minute * 60 + dt.dt.second
+        )
+        df["local_time_sin"] = np.sin(theta)
+        df["local_time_cos"] = np.cos(theta)
+
+    df["is_starlink"] = df["satellite_name"].str.contains(
+        "STARLINK", case=False, na=False
+    )
+
+    basis = np.where(
+        df["perigee_km"].notna() & df["apogee_km"].notna(),
+        df["perigee_km"],
+        df["altitude_km"],
+    )
+    # Mask-based selection over the whole column; NaN falls through to "".
+    df["orbit_class"] = np.select(
+        [np.isnan(basis), basis < 2000, basis > 20000],
+        ["", "LEO", "GEO"],
+        default="MEO",
+    )
+    return df
+
+
+def _as_float(value):
+    """Coerce an input field to float, mapping None/unparseable to NaN."""
+    if value is None:
+        return float("nan")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def derive_from_row(row):
+    """Fill the derived-feature columns of one row dict in place.
+
+    Inputs are coerced to floats up front; everything after that is
+    straight-line code that lets NaN propagate through the kernel, so
+    missing or malformed fields yield NaN columns without exception
+    handling on the hot path.
+    """
+    x = _as_float(row.get("temex"))
+    y = _as_float(row.get("temey"))
+    z = _as_float(row.get("temez"))
+
+    vx = _as_float(row.get("velx"))
+    vy = _as_float(row.get("vely"))
+    vz = _as_float(row.get("velz"))
+    if math.isnan(vx) or math.isnan(vy) or math.isnan(vz):
+        # Rows may carry only the magnitude; the kernel just needs the norm.
+        vx = _as_float(row.get("velocity_mag_kms"))
+        vy = vz = 0.0
+
+    sec = float("nan")
+    ts_val = row.get("timestamp_utc")
+    if isinstance(ts_val, str) and ts_val:
+        try:
+            dt = datetime.fromisoformat(ts_val.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+        else:
+            sec = float(dt.hour * 3600 + dt.minute * 60 + dt.second)
+
+    alt, _, ratio, time_sin, time_cos = _derive(x, y, z, vx, vy, vz, sec)
+    row["altitude_km"] = alt
+    row["speed_to_alt_ratio"] = ratio
+    row["local_time_sin"] = time_sin
+    row["local_time_cos"] = time_cos
+
+    name = row.get("satellite_name") or ""
+    row["is_starlink"] = "STARLINK" in str(name).upper()
+
+    perigee = _as_float(row.get("perigee_km"))
+    apogee = _as_float(row.get("apogee_km"))
+    basis = alt if math.isnan(perigee) or math.isnan(apogee) else perigee
+    if math.isnan(basis):
+        row["orbit_class"] = ""
+    elif basis < 2000:
+        row["orbit_class"] = "LEO"
+    elif basis > 20000:
+        row["orbit_class"] = "GEO"
+    else:
+        row["orbit_class"] = "MEO"
+
+    return row
@@ -0,0 +1,63 @@
+"""Small file-output helpers shared by the pipeline scripts."""
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+
+def ensure_parent_dir(file_path):
+    """Create the parent directory of ``file_path`` if it does not exist."""
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+
+def _df_to_table(df, arrow_schema):
+    """Convert a chunk to an Arrow table, parsing stringly timestamps."""
+    df = df.copy()
+    for field in arrow_schema:
+        if pa.types.is_timestamp(field.type) and df[field.name].dtype == object:
+            df[field.name] = pd.to_datetime(df[field.name], utc=True)
+    return pa.Table.from_pandas(df, schema=arrow_schema, preserve_index=False)
+
+
+class _StreamingSink:
+    """Base for the chunk sinks: one writer per run, all state in memory.
+
+    The parent directory is created and the writer opened exactly once in
+    the constructor, so writing a chunk costs zero filesystem stat calls.
+    Subclasses provide ``_open``.
+    """
+
+    def __init__(self, file_path, arrow_schema):
+        ensure_parent_dir(file_path)
+        self._schema = arrow_schema
+        self._writer = self._open(str(file_path), arrow_schema)
+
+    def write(self, df):
+        """Append one DataFrame chunk."""
+        self._writer.write_table(_df_to_table(df, self._schema))
+
+    def close(self):
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvSink(_StreamingSink):
+    """Streams DataFrame chunks into one CSV file via Arrow's C++ writer."""
+
+    def _open(self, path, arrow_schema):
+        return pa_csv.CSVWriter(path, arrow_schema)
+
+
+class ParquetSink(_StreamingSink):
+    """Streams DataFrame chunks into one zstd-compressed Parquet file."""
+
+    def _open(self, path, arrow_schema):
+        return pq.ParquetWriter(path, arrow_schema, compression="zstd")
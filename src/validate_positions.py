@@ -0,0 +1,66 @@
+"""Sanity checks over a generated position dataset."""
+
+import argparse
+import sys
+
+import pandas as pd
+
+from src import schema as schema_mod
+
+RANGE_CHECKS = {
+    "subpoint_lat_deg": (-90.0, 90.0),
+    "subpoint_lon_deg": (-180.0, 180.0),
+    "velocity_mag_kms": (0.0, 15.0),
+    "eccentricity": (0.0, 1.0),
+    "inclination_deg": (0.0, 180.0),
+}
+
+
+def _load_table(path):
+    """Load a positions file (Parquet or CSV) with parsed timestamps."""
+    if str(path).lower().endswith(".csv"):
+        return pd.read_csv(path, parse_dates=["timestamp_utc", "tle_epoch_utc"])
+    return pd.read_parquet(path)
+
+
+def validate_dataframe(df):
+    """Run schema and physical-range checks; return ``(ok, report)``."""
+    ok, report = schema_mod.validate_dataframe(df)
+    report["range_violations"] = {}
+
+    cols = [c for c in RANGE_CHECKS if c in df.columns]
+    if cols:
+        sub = df[cols]
+        lo = pd.Series({c: RANGE_CHECKS[c][0] for c in cols})
+        hi = pd.Series({c: RANGE_CHECKS[c][1] for c in cols})
+        bad = (sub.lt(lo) | sub.gt(hi)).sum()
+        stats = sub.agg(["min", "max"])
+        for c in cols:
+            if bad[c]:
+                report["range_violations"][c] = {
+                    "count": int(bad[c]),
+                    "min": stats.loc["min", c],
+                    "max": stats.loc["max", c],
+                }
+                ok = False
+
+    report["n_rows"] = len(df)
+    return ok, report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate a positions file.")
+    parser.add_argument("path", help="file produced by compute_positions")
+    args = parser.parse_args(argv)
+
+    df = _load_table(args.path)
+    ok, report = validate_dataframe(df)
+    for key in ("missing_columns", "unexpected_columns", "range_violations"):
+        if report.get(key):
+            print(f"{key}: {report[key]}")
+    print(f"{report['n_rows']} rows, {'OK' if ok else 'FAILED'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+import math
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from src import compute_positions, schema
+from src.features.derive_features import derive_from_frame, derive_from_row
+from src.validate_positions import _load_table, validate_dataframe
+
+TLE_TEXT = """\
+ISS (ZARYA)
+1 25544U 98067A   24001.50000000  .00016717  00000+0  30276-3 0  9991
+2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.49560532428090
+STARLINK-1007
+1 44713U 19074A   24001.25000000  .00002514  00000+0  17949-3 0  9993
+2 44713  53.0540 193.7652 0001531  85.0159 275.1005 15.06390719212194
+"""
+
+
+@pytest.fixture
+def tle_file(tmp_path):
+    path = tmp_path / "sample.tle"
+    path.write_text(TLE_TEXT)
+    return path
+
+
+def test_build_time_grid_inclusive():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = start + timedelta(minutes=30)
+    grid = compute_positions._build_time_grid(start, end, timedelta(minutes=10))
+    assert len(grid) == 4
+    assert grid[0] == start
+    assert grid[-1] == end
+
+
+def test_schema_columns_unique():
+    names = schema.get_column_names()
+    assert len(names) == len(set(names))
+    assert "timestamp_utc" in names
+    assert "velocity_mag_kms" in names
+
+
+def test_schema_column_defaults():
+    assert set(schema.COLUMN_DEFAULTS) == set(schema.get_column_names())
+    assert math.isnan(schema.COLUMN_DEFAULTS["alt_deg"])
+    assert schema.COLUMN_DEFAULTS["orbit_class"] == ""
+    assert schema.COLUMN_DEFAULTS["is_starlink"] is False
+
+
+def test_derive_from_row_basics():
+    row = {
+        "temex": 6771.0, "temey": 0.0, "temez": 0.0,
+        "velocity_mag_kms": 7.66,
+        "timestamp_utc": "2024-01-01T06:00:00Z",
+        "satellite_name": "STARLINK-1007",
+        "perigee_km": 540.0, "apogee_km": 560.0,
+    }
+    derive_from_row(row)
+    assert row["altitude_km"] == pytest.approx(400.0)
+    assert row["speed_to_alt_ratio"] == pytest.approx(7.66 / 400.0)
+    assert row["local_time_sin"] == pytest.approx(1.0)
+    assert row["is_starlink"] is True
+    assert row["orbit_class"] == "LEO"
+
+
+def test_derive_from_row_bad_inputs():
+    row = {"temex": None, "temey": None, "temez": None,
+           "velocity_mag_kms": None, "timestamp_utc": None,
+           "satellite_name": None}
+    derive_from_row(row)
+    assert math.isnan(row["altitude_km"])
+    assert math.isnan(row["speed_to_alt_ratio"])
+    assert row["orbit_class"] == ""
+
+
+def test_validate_dataframe_flags_range_violations(tle_file, tmp_path):
+    out = tmp_path / "positions.parquet"
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    compute_positions.process_tle_file(
+        tle_file, out, start, start + timedelta(minutes=10),
+        timedelta(minutes=10),
+    )
+    df = _load_table(out)
+    df.loc[0, "subpoint_lat_deg"] = 123.0
+    ok, report = validate_dataframe(df)
+    assert not ok
+    assert report["range_violations"]["subpoint_lat_deg"]["count"] == 1
+    assert report["numeric_summary"]["velocity_mag_kms"]["n_missing"] == 0
+
+
+def test_derive_from_frame_matches_row():
+    rows = [
+        {
+            "temex": 6771.0, "temey": 0.0, "temez": 0.0,
+            "velocity_mag_kms": 7.66,
+            "timestamp_utc": "2024-01-01T06:00:00Z",
+            "satellite_name": "STARLINK-1007",
+            "perigee_km": 540.0, "apogee_km": 560.0,
+        },
+        {
+            "temex": 20000.0, "temey": 15000.0, "temez": 3000.0,
+            "velocity_mag_kms": 3.9,
+            "timestamp_utc": "2024-01-01T18:30:00Z",
+            "satellite_name": "GPS BIIR-2",
+            "perigee_km": float("nan"), "apogee_km": float("nan"),
+        },
+    ]
+    df = pd.DataFrame([dict(r) for r in rows])
+    derive_from_frame(df)
+    for i, row in enumerate(rows):
+        derive_from_row(row)
+        for col in ("altitude_km", "speed_to_alt_ratio",
+                    "local_time_sin", "local_time_cos"):
+            assert df[col].iloc[i] == pytest.approx(row[col])
+        assert bool(df["is_starlink"].iloc[i]) == row["is_starlink"]
+        assert df["orbit_class"].iloc[i] == row["orbit_class"]
+
+
+def test_subpoint_matches_skyfield(tle_file, tmp_path):
+    from skyfield.api import load, wgs84
+
+    out = tmp_path / "positions.csv"
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    compute_positions.process_tle_file(
+        tle_file, out, start, start + timedelta(minutes=20),
+        timedelta(minutes=10),
+    )
+    df = pd.read_csv(out)
+
+    ts = load.timescale()
+    sats = load.tle_file(str(tle_file), ts=ts)
+    for sat in sats:
+        rows = df[df.satellite_name == sat.name]
+        for _, row in rows.iterrows():
+            dt = datetime.fromisoformat(row.timestamp_utc.replace("Z", "+00:00"))
+            t = ts.utc(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+            sp = wgs84.subpoint(sat.at(t))
+            assert row.subpoint_lat_deg == pytest.approx(sp.latitude.degrees, abs=1e-3)
+            assert row.subpoint_lon_deg == pytest.approx(sp.longitude.degrees, abs=1e-3)
+
+
+def test_process_tle_file_end_to_end(tle_file, tmp_path):
+    out = tmp_path / "positions.parquet"
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = start + timedelta(minutes=30)
+    total = compute_positions.process_tle_file(
+        tle_file, out, start, end, timedelta(minutes=10),
+        observer=(52.0, 4.0, 0.0), chunk_size=3,
+    )
+    assert total == 2 * 4
+
+    df = _load_table(out)
+    assert len(df) == total
+    assert list(df.columns) == schema.get_column_names()
+    assert df["temex"].dtype == "float64"
+    assert df["altitude_km"].dtype == "float32"
+    assert df["velocity_mag_kms"].between(6.5, 8.5).all()
+    assert df["subpoint_lat_deg"].abs().le(90).all()
+    assert (df["sgp4_error_code"] == 0).all()
+    assert df["alt_deg"].notna().all()
+
+    ok, report = validate_dataframe(df)
+    assert ok, report
+    assert not report["range_violations"]
+    assert df[df.satellite_name == "STARLINK-1007"]["is_starlink"].all()
+    assert (df["orbit_class"] == "LEO").all()
+
+
+def test_parallel_matches_serial(tle_file, tmp_path):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = start + timedelta(minutes=30)
+    kwargs = dict(observer=(52.0, 4.0, 0.0), chunk_size=4)
+
+    serial = tmp_path / "serial.parquet"
+    parallel = tmp_path / "parallel.parquet"
+    compute_positions.process_tle_file(
+        tle_file, serial, start, end, timedelta(minutes=10),
+        workers=1, **kwargs)
+    compute_positions.process_tle_file(
+        tle_file, parallel, start, end, timedelta(minutes=10),
+        workers=2, **kwargs)
+
+    df_s = _load_table(serial)
+    df_p = _load_table(parallel)
+    pd.testing.assert_frame_equal(df_s, df_p)